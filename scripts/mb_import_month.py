@@ -26,12 +26,21 @@ Notes:
   to dedupe/group later.
 """
 
+import io
 import os
 import json
 import time
+import asyncio
+import tempfile
+import threading
 import argparse
 import calendar
-from typing import Any, Dict, List, Optional, Tuple
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from multiprocessing import Pool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote_plus
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -39,6 +48,26 @@ from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    import aiohttp  # pip install aiohttp (optional; enables concurrent fetch)
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson  # pip install orjson (optional; much faster JSON encode/decode)
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # pip install ijson (optional; enables --stream-parse)
+except ImportError:
+    ijson = None
+
+try:
+    import requests_cache  # pip install requests-cache (optional; caches MB pages across re-runs)
+except ImportError:
+    requests_cache = None
+
 # -------------------------
 # MusicBrainz configuration
 # -------------------------
@@ -55,8 +84,19 @@ DEFAULT_OUT_DIR = "mb_out"
 # -------------------------
 # HTTP: Session + retries
 # -------------------------
-def make_session() -> requests.Session:
-    s = requests.Session()
+def make_session(use_cache: bool = True) -> requests.Session:
+    if use_cache and requests_cache is not None:
+        # Development re-runs hit the exact same URLs; a day of sqlite-backed
+        # caching turns those into local reads (and skips the MB throttle).
+        s: requests.Session = requests_cache.CachedSession(
+            "mb_cache",
+            backend="sqlite",
+            expire_after=86400,
+            allowable_methods=("GET",),
+            stale_if_error=True,
+        )
+    else:
+        s = requests.Session()
     retries = Retry(
         total=8,
         connect=8,
@@ -64,9 +104,15 @@ def make_session() -> requests.Session:
         backoff_factor=0.8,
         status_forcelist=(429, 500, 502, 503, 504),
         allowed_methods=("GET",),
-        raise_on_status=False,
+        # Let urllib3's retry machinery absorb 429/5xx (with backoff and MB's
+        # Retry-After honored) instead of handing the response back for mb_get
+        # to turn into a RuntimeError that nothing retries.
+        raise_on_status=True,
+        respect_retry_after_header=True,
     )
-    adapter = HTTPAdapter(max_retries=retries, pool_connections=10, pool_maxsize=10)
+    # This session talks to one host from one thread; a single kept-alive
+    # connection avoids stale-slot reuse and repeat TLS handshakes.
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=1, pool_maxsize=1)
     s.mount("https://", adapter)
     s.mount("http://", adapter)
     return s
@@ -75,30 +121,198 @@ def make_session() -> requests.Session:
 SESSION = make_session()
 
 
+def _mb_cache_has(url: str, params: Dict[str, Any]) -> bool:
+    """True if this GET has a *fresh* entry in the requests-cache store.
+
+    A cache-served response never leaves the machine, so the MB throttle does
+    not apply to it. Freshness matters: a bare contains() check also matches
+    expired entries, which CachedSession refetches from the network — those
+    must still pay the throttle.
+    """
+    if requests_cache is None or not isinstance(SESSION, requests_cache.CachedSession):
+        return False
+    try:
+        req = requests.Request("GET", url, params=params).prepare()
+        cached = SESSION.cache.get_response(SESSION.cache.create_key(req))
+        return cached is not None and not cached.is_expired
+    except Exception:
+        return False
+
+
+class _RateLimiter:
+    """Sync counterpart of _AsyncRateLimiter: >= sleep_s between request
+    *starts*, and only for real remote calls.
+
+    MB's policy is start-to-start, so time already spent on the previous
+    request's RTT (and any local work since) counts toward the window;
+    acquire() sleeps only the remainder instead of a full flat sleep_s. If
+    the response then turns out to have been served from cache anyway
+    (revalidation, or a pre-check miss), rollback() restores the previous
+    timestamp so the next real request does not wait behind a call that
+    never left the machine.
+    """
+
+    def __init__(self):
+        self._last_start = float("-inf")
+        self._prev_start = float("-inf")
+
+    def acquire(self, sleep_s: float):
+        now = time.monotonic()
+        wait = sleep_s - (now - self._last_start)
+        if wait > 0:
+            time.sleep(wait)
+            now = time.monotonic()
+        self._prev_start = self._last_start
+        self._last_start = now
+
+    def rollback(self):
+        self._last_start = self._prev_start
+
+
+_RATE_LIMITER = _RateLimiter()
+
+
 def mb_get(path: str, params: Dict[str, Any], sleep_s: float = DEFAULT_SLEEP_S) -> Dict[str, Any]:
     headers = {"User-Agent": UA}
     url = f"{MB_BASE}{path}"
 
-    time.sleep(sleep_s)
+    cached = _mb_cache_has(url, params)
+    if not cached:
+        _RATE_LIMITER.acquire(sleep_s)
 
     r = SESSION.get(url, params=params, headers=headers, timeout=(10, 90))
+    if not cached and getattr(r, "from_cache", False):
+        _RATE_LIMITER.rollback()
+    # Retryable statuses (429/5xx) are exhausted inside the adapter and raise
+    # there; anything 4xx left here is a real client error (e.g. bad query),
+    # so surface MB's error detail.
     if r.status_code >= 400:
         try:
-            detail = r.json()
+            detail = orjson.loads(r.content) if orjson is not None else r.json()
         except Exception:
-            detail = r.text[:500]
+            detail = r.content[:500].decode("utf-8", errors="replace")
         raise RuntimeError(f"MB error {r.status_code} for {r.url}\n{detail}")
 
+    # r.content is already bytes; orjson skips requests' encoding sniff + str decode
+    if orjson is not None:
+        return orjson.loads(r.content)
     return r.json()
 
 
+def mb_get_stream(
+    path: str, params: Dict[str, Any], sleep_s: float = DEFAULT_SLEEP_S, prefix: str = "releases.item"
+) -> Iterator[Dict[str, Any]]:
+    """Yield items from an MB response one at a time via ijson (--stream-parse).
+
+    Only one release is materialized at a time instead of the full multi-MB
+    page dict, so peak RSS stays flat regardless of page size.
+    """
+    headers = {"User-Agent": UA}
+    url = f"{MB_BASE}{path}"
+
+    cached = _mb_cache_has(url, params)
+    if not cached:
+        _RATE_LIMITER.acquire(sleep_s)
+
+    r = SESSION.get(url, params=params, headers=headers, timeout=(10, 90), stream=True)
+    if not cached and getattr(r, "from_cache", False):
+        _RATE_LIMITER.rollback()
+    if r.status_code >= 400:
+        try:
+            detail = orjson.loads(r.content) if orjson is not None else r.json()
+        except Exception:
+            detail = r.content[:500].decode("utf-8", errors="replace")
+        raise RuntimeError(f"MB error {r.status_code} for {r.url}\n{detail}")
+
+    if getattr(r, "from_cache", False):
+        # Cache-served bodies are already fully in memory, and requests-cache's
+        # replayed raw stream treats ijson's read(0) probe as EOF — iterate the
+        # buffered content instead.
+        yield from ijson.items(io.BytesIO(r.content), prefix)
+    else:
+        r.raw.decode_content = True  # undo gzip before ijson sees the bytes
+        yield from ijson.items(r.raw, prefix)
+
+
+# -------------------------
+# HTTP: async (aiohttp) path
+# -------------------------
+class _AsyncRateLimiter:
+    """Enforce >= sleep_s between request *starts*, globally.
+
+    MB's policy is ~1 req/sec start-to-start, so server RTT can overlap the
+    waiting window instead of stacking on top of it (as the serial
+    sleep-then-get path does).
+    """
+
+    def __init__(self, sleep_s: float):
+        self.sleep_s = sleep_s
+        self._lock = asyncio.Lock()
+        self._next_allowed = 0.0
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now = time.monotonic()
+            self._next_allowed = now + self.sleep_s
+
+
+async def mb_get_async(
+    session: "aiohttp.ClientSession",
+    limiter: _AsyncRateLimiter,
+    path: str,
+    params: Dict[str, Any],
+    max_attempts: int = 8,
+    backoff_factor: float = 0.8,
+) -> Dict[str, Any]:
+    url = f"{MB_BASE}{path}"
+    # aiohttp wants string query values
+    params = {k: str(v) for k, v in params.items()}
+
+    last_error: Optional[Exception] = None
+    for attempt in range(max_attempts):
+        if attempt:
+            await asyncio.sleep(backoff_factor * (2 ** (attempt - 1)))
+        await limiter.acquire()
+        try:
+            async with session.get(url, params=params) as r:
+                body = await r.read()
+                if r.status in (429, 500, 502, 503, 504):
+                    last_error = RuntimeError(f"MB error {r.status} for {r.url}")
+                    continue
+                if r.status >= 400:
+                    try:
+                        detail = orjson.loads(body) if orjson is not None else json.loads(body)
+                    except Exception:
+                        detail = body[:500].decode("utf-8", errors="replace")
+                    raise RuntimeError(f"MB error {r.status} for {r.url}\n{detail}")
+                if orjson is not None:
+                    return orjson.loads(body)
+                return json.loads(body)
+        except aiohttp.ClientError as e:
+            last_error = e
+            continue
+
+    raise RuntimeError(f"MB request failed after {max_attempts} attempts: {url}\n{last_error}")
+
+
 # -------------------------
 # Normalization helpers
 # -------------------------
 def safe_join_artist(artist_credit: List[Dict[str, Any]]) -> str:
     if not artist_credit:
         return "Unknown"
-    return "".join([ac.get("name", "") + ac.get("joinphrase", "") for ac in artist_credit]).strip() or "Unknown"
+    # Single-credit releases are the overwhelmingly common case: no join and
+    # no intermediate list (a lone trailing joinphrase falls through).
+    if len(artist_credit) == 1:
+        ac = artist_credit[0]
+        if not ac.get("joinphrase"):
+            return (ac.get("name") or "").strip() or "Unknown"
+    joined = "".join(ac.get("name", "") + ac.get("joinphrase", "") for ac in artist_credit)
+    return joined.strip() or "Unknown"
 
 
 def extract_country(release: Dict[str, Any]) -> Optional[str]:
@@ -130,27 +344,43 @@ def extract_media_type(release: Dict[str, Any]) -> str:
     return "Unknown"
 
 
+# Relation type -> result key, so the hot loop does one dict lookup instead of
+# a chain of string comparisons per relation.
+_REL_TYPE_DISPATCH = {
+    "spotify": "spotify_url",
+    "itunes": "apple_music_url",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _ytm_url(artist: str, title: str) -> str:
+    # The same (artist, title) pair recurs across a release's country/format
+    # variants within a month, so the quote_plus work caches well.
+    return f"https://music.youtube.com/search?q={quote_plus(artist)}+{quote_plus(title)}"
+
+
 def extract_links(release: Dict[str, Any], artist: str, title: str) -> Tuple[Optional[str], Optional[str], Optional[str], str]:
-    spotify_url = None
-    apple_music_url = None
-    bandcamp_url = None
+    results: Dict[str, Optional[str]] = {
+        "spotify_url": None,
+        "apple_music_url": None,
+        "bandcamp_url": None,
+    }
 
     relations = release.get("relations", []) or []
     for rel in relations:
         target = (rel.get("url") or {}).get("resource")
-        rel_type = rel.get("type")
         if not target:
             continue
 
-        if rel_type == "spotify":
-            spotify_url = target
-        elif rel_type == "itunes" or ("music.apple.com" in target):
-            apple_music_url = target
+        key = _REL_TYPE_DISPATCH.get(rel.get("type"))
+        if key:
+            results[key] = target
+        elif "music.apple.com" in target:
+            results["apple_music_url"] = target
         elif "bandcamp.com" in target:
-            bandcamp_url = target
+            results["bandcamp_url"] = target
 
-    youtube_music_url = f"https://music.youtube.com/search?q={artist.replace(' ', '+')}+{title.replace(' ', '+')}"
-    return spotify_url, apple_music_url, bandcamp_url, youtube_music_url
+    return results["spotify_url"], results["apple_music_url"], results["bandcamp_url"], _ytm_url(artist, title)
 
 
 def extract_tags(release: Dict[str, Any], limit: int = 10) -> List[str]:
@@ -163,27 +393,88 @@ def extract_tags(release: Dict[str, Any], limit: int = 10) -> List[str]:
     return out[:limit]
 
 
-def normalize_release(release: Dict[str, Any]) -> Dict[str, Any]:
-    mb_release_id = release.get("id")
-    title = release.get("title", "Unknown") or "Unknown"
-    date_str = release.get("date")  # YYYY-MM-DD (often), sometimes YYYY or YYYY-MM
-
-    release_group = release.get("release-group") or {}
-    mb_release_group_id = release_group.get("id")
-
-    artist = safe_join_artist(release.get("artist-credit", []) or [])
-    media_type = extract_media_type(release)
-    track_count = release.get("track-count")
-    country = extract_country(release)
-    label = extract_label(release)
-
-    spotify_url, apple_music_url, bandcamp_url, youtube_music_url = extract_links(release, artist, title)
+# Core fields kept by --minimal (must match the albums table schema)
+MINIMAL_FIELDS = {
+    "mb_release_id",
+    "mb_release_group_id",
+    "album",
+    "artist",
+    "release_date",
+    "label",
+    "cover_url",
+}
+
+
+def normalize_release(release: Dict[str, Any], keep_raw: bool = False) -> Dict[str, Any]:
+    """Build one normalized row from a raw MB release.
+
+    The extract_* helpers are inlined here as a single pass over locals: this
+    function runs once per release, and across a month the five extra call
+    frames plus repeated release.get() lookups are measurable interpreter
+    overhead. The standalone helpers above stay for one-off use.
+    """
+    get = release.get
+
+    mb_release_id = get("id")
+    title = get("title") or "Unknown"
+    date_str = get("date")  # YYYY-MM-DD (often), sometimes YYYY or YYYY-MM
+    mb_release_group_id = (get("release-group") or {}).get("id")
+    track_count = get("track-count")
+
+    artist = safe_join_artist(get("artist-credit") or [])
+
+    # media type
+    media = get("media") or ()
+    media_type = (media[0].get("format") or "Unknown") if media else "Unknown"
+
+    # country
+    country = get("country") or None
+    if not country:
+        events = get("release-events") or ()
+        if events:
+            iso_codes = (events[0].get("area") or {}).get("iso-3166-1-codes") or ()
+            if iso_codes:
+                country = iso_codes[0]
+
+    # label
+    label = None
+    for li in get("label-info") or ():
+        lbl = li.get("label")
+        if lbl and lbl.get("name"):
+            label = lbl["name"]
+            break
+
+    # links
+    links: Dict[str, Optional[str]] = {
+        "spotify_url": None,
+        "apple_music_url": None,
+        "bandcamp_url": None,
+    }
+    for rel in get("relations") or ():
+        target = (rel.get("url") or {}).get("resource")
+        if not target:
+            continue
+        key = _REL_TYPE_DISPATCH.get(rel.get("type"))
+        if key:
+            links[key] = target
+        elif "music.apple.com" in target:
+            links["apple_music_url"] = target
+        elif "bandcamp.com" in target:
+            links["bandcamp_url"] = target
+    youtube_music_url = _ytm_url(artist, title)
 
-    tags_list = extract_tags(release, limit=10)
+    # tags
+    tags_list: List[str] = []
+    for t in get("tags") or ():
+        name = t.get("name")
+        if name:
+            tags_list.append(name)
+            if len(tags_list) == 10:
+                break
 
     cover_url = f"https://coverartarchive.org/release/{mb_release_id}/front" if mb_release_id else None
 
-    return {
+    row = {
         # identity
         "mb_release_id": mb_release_id,
         "mb_release_group_id": mb_release_group_id,
@@ -201,15 +492,55 @@ def normalize_release(release: Dict[str, Any]) -> Dict[str, Any]:
         "country": country,
 
         # links
-        "spotify_url": spotify_url,
-        "apple_music_url": apple_music_url,
+        "spotify_url": links["spotify_url"],
+        "apple_music_url": links["apple_music_url"],
         "youtube_music_url": youtube_music_url,
-        "bandcamp_url": bandcamp_url,
+        "bandcamp_url": links["bandcamp_url"],
 
         # raw-ish
         "tags": tags_list,
-        "full_json": release,
     }
+    # Embedding the raw release doubles-to-triples dump size; opt in via --keep-raw
+    if keep_raw:
+        row["full_json"] = release
+    return row
+
+
+def _normalize_release_minimal(release: Dict[str, Any]) -> Dict[str, Any]:
+    """Build only the MINIMAL_FIELDS row, directly.
+
+    Skips the link/media/country/tag extraction and the 14-key dict that a
+    normalize-then-strip pass would allocate per row, and keeps the bulky
+    full_json off the pool's pickle boundary under --minimal.
+    """
+    get = release.get
+    mb_release_id = get("id")
+
+    label = None
+    for li in get("label-info") or ():
+        lbl = li.get("label")
+        if lbl and lbl.get("name"):
+            label = lbl["name"]
+            break
+
+    return {
+        "mb_release_id": mb_release_id,
+        "mb_release_group_id": (get("release-group") or {}).get("id"),
+        "album": get("title") or "Unknown",
+        "artist": safe_join_artist(get("artist-credit") or []),
+        "release_date": get("date"),
+        "label": label,
+        "cover_url": f"https://coverartarchive.org/release/{mb_release_id}/front" if mb_release_id else None,
+    }
+
+
+def make_normalizer(minimal: bool, keep_raw: bool = False):
+    """Pick the per-release worker once, outside the hot loop / process pool."""
+    if minimal:
+        return _normalize_release_minimal
+    if keep_raw:
+        return functools.partial(normalize_release, keep_raw=True)
+    return normalize_release
 
 
 # -------------------------
@@ -228,30 +559,148 @@ def get_supabase_client():
     return create_client(url, key)
 
 
-def supabase_upsert_rows(table: str, rows: List[Dict[str, Any]], on_conflict: str):
-    sb = get_supabase_client()
+def supabase_upsert_rows(sb, table: str, rows: List[Dict[str, Any]], on_conflict: str):
+    if orjson is not None:
+        # supabase-py serializes each batch with stdlib json.dumps, which is
+        # the dominant per-chunk CPU cost for large rows. Pre-encode with
+        # orjson and post straight through the underlying PostgREST session
+        # (base_url + auth headers already configured on it).
+        resp = sb.postgrest.session.post(
+            f"/{table}",
+            params={"on_conflict": on_conflict},
+            content=orjson.dumps(rows),
+            headers={
+                "Content-Type": "application/json",
+                "Prefer": "resolution=merge-duplicates,return=minimal",
+            },
+        )
+        resp.raise_for_status()
+        return resp
     return sb.table(table).upsert(rows, on_conflict=on_conflict).execute()
 
 
 # -------------------------
 # Fetch releases (network)
 # -------------------------
-def fetch_month_releases(year: int, month: int, sleep_s: float, page_size: int = 100) -> List[Dict[str, Any]]:
+def _range_query(start_date: str, end_date: str) -> str:
+    return f"date:[{start_date} TO {end_date}] AND status:official AND primarytype:Album"
+
+
+def _month_range(year: int, month: int) -> Tuple[str, str]:
+    _, last_day = calendar.monthrange(year, month)
+    return f"{year}-{month:02d}-01", f"{year}-{month:02d}-{last_day:02d}"
+
+
+def _week_ranges(year: int, month: int) -> List[Tuple[str, str]]:
+    """Split a month into ~7-day date ranges (fallback when a month >10k hits)."""
     _, last_day = calendar.monthrange(year, month)
-    all_releases: List[Dict[str, Any]] = []
+    return [
+        (f"{year}-{month:02d}-{start:02d}", f"{year}-{month:02d}-{min(start + 6, last_day):02d}")
+        for start in range(1, last_day + 1, 7)
+    ]
+
+
+def _fetch_range(
+    start_date: str,
+    end_date: str,
+    sleep_s: float,
+    page_size: int,
+    abort_over: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Fetch one date-range query, paginating on offset.
+
+    Returns (releases, total_count). If abort_over is set and the reported
+    count exceeds it, gives up after the first page so the caller can split
+    the range instead of burning requests against the safety cap.
+    """
+    query = _range_query(start_date, end_date)
+    releases: List[Dict[str, Any]] = []
+    offset = 0
+    total_count: Optional[int] = None
 
-    for day in range(1, last_day + 1):
-        date_str = f"{year}-{month:02d}-{day:02d}"
-        print(f"\n--- Processing Date: {date_str} ---", flush=True)
+    while True:
+        try:
+            data = mb_get(
+                "/release",
+                {
+                    "query": query,
+                    "fmt": "json",
+                    "limit": page_size,
+                    "offset": offset,
+                    "inc": "url-rels",
+                },
+                sleep_s=sleep_s,
+            )
+
+            if total_count is None:
+                total_count = int(data.get("count", 0))
+                print(f"  Total results for {start_date}..{end_date}: {total_count}", flush=True)
+                if abort_over is not None and total_count > abort_over:
+                    return [], total_count
+
+            rels = data.get("releases", []) or []
+            if not rels:
+                break
 
-        query = f"date:{date_str} AND status:official AND primarytype:Album"
+            releases.extend(rels)
+            offset += len(rels)
+
+            if offset >= total_count:
+                break
+
+            if offset > 10000:
+                print(f"  [Warn] Hit safety limit for {start_date}..{end_date}.", flush=True)
+                break
+
+        except Exception as e:
+            print(f"  [Error] Failed fetching page for {start_date}..{end_date}: {e}", flush=True)
+            break
+
+    print(f"  > Collected {len(releases)} releases for {start_date}..{end_date}", flush=True)
+    return releases, total_count or 0
+
+
+def fetch_month_releases(year: int, month: int, sleep_s: float, page_size: int = 100) -> List[Dict[str, Any]]:
+    # One range query for the whole month collapses the old 28-31 per-day
+    # query pipelines into a single paginated one; only if the month blows
+    # past the 10k search window do we split week-by-week.
+    start_date, end_date = _month_range(year, month)
+    print(f"\n--- Processing Range: {start_date} .. {end_date} ---", flush=True)
+
+    releases, total_count = _fetch_range(start_date, end_date, sleep_s, page_size, abort_over=10000)
+    if total_count > 10000:
+        print(f"[Warn] {total_count} results exceed the 10k window; splitting into weeks.", flush=True)
+        releases = []
+        for week_start, week_end in _week_ranges(year, month):
+            print(f"\n--- Processing Range: {week_start} .. {week_end} ---", flush=True)
+            week_releases, _ = _fetch_range(week_start, week_end, sleep_s, page_size)
+            releases.extend(week_releases)
+
+    return releases
+
+
+def fetch_month_releases_stream(
+    year: int, month: int, sleep_s: float, page_size: int = 100
+) -> Iterator[Dict[str, Any]]:
+    """Streaming variant of fetch_month_releases (--stream-parse).
+
+    Yields releases as they are parsed off the wire; nothing holds the whole
+    month in memory. The streamed parse skips the "count" header, so this
+    path always goes week-by-week (still a handful of query pipelines, and
+    each stays comfortably inside the 10k search window) and paginates each
+    range until the first empty page.
+    """
+    for start_date, end_date in _week_ranges(year, month):
+        print(f"\n--- Processing Range: {start_date} .. {end_date} ---", flush=True)
+
+        query = _range_query(start_date, end_date)
         offset = 0
-        total_count_for_day = None
-        day_count = 0
+        range_count = 0
 
         while True:
             try:
-                data = mb_get(
+                page_count = 0
+                for rel in mb_get_stream(
                     "/release",
                     {
                         "query": query,
@@ -261,34 +710,106 @@ def fetch_month_releases(year: int, month: int, sleep_s: float, page_size: int =
                         "inc": "url-rels",
                     },
                     sleep_s=sleep_s,
-                )
-
-                if total_count_for_day is None:
-                    total_count_for_day = int(data.get("count", 0))
-                    print(f"  Total results for {date_str}: {total_count_for_day}", flush=True)
+                ):
+                    page_count += 1
+                    yield rel
 
-                rels = data.get("releases", []) or []
-                if not rels:
+                if not page_count:
                     break
 
-                all_releases.extend(rels)
-                day_count += len(rels)
-                offset += len(rels)
-
-                if offset >= total_count_for_day:
-                    break
+                range_count += page_count
+                offset += page_count
 
                 if offset > 10000:
-                    print(f"  [Warn] Hit safety limit for {date_str}, moving to next day.", flush=True)
+                    print(f"  [Warn] Hit safety limit for {start_date}..{end_date}.", flush=True)
                     break
 
             except Exception as e:
-                print(f"  [Error] Failed fetching page for {date_str}: {e}", flush=True)
+                print(f"  [Error] Failed fetching page for {start_date}..{end_date}: {e}", flush=True)
                 break
 
-        print(f"  > Collected {day_count} releases for {date_str}", flush=True)
+        print(f"  > Collected {range_count} releases for {start_date}..{end_date}", flush=True)
+
+
+async def _fetch_range_async(
+    session: "aiohttp.ClientSession",
+    limiter: _AsyncRateLimiter,
+    start_date: str,
+    end_date: str,
+    page_size: int,
+    abort_over: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    query = _range_query(start_date, end_date)
+
+    def page_params(offset: int) -> Dict[str, Any]:
+        return {
+            "query": query,
+            "fmt": "json",
+            "limit": page_size,
+            "offset": offset,
+            "inc": "url-rels",
+        }
+
+    try:
+        first = await mb_get_async(session, limiter, "/release", page_params(0))
+    except Exception as e:
+        print(f"  [Error] Failed fetching page for {start_date}..{end_date}: {e}", flush=True)
+        return [], 0
+
+    total_count = int(first.get("count", 0))
+    print(f"  Total results for {start_date}..{end_date}: {total_count}", flush=True)
+    if abort_over is not None and total_count > abort_over:
+        return [], total_count
+
+    releases = list(first.get("releases", []) or [])
+
+    # Remaining pages are known from count: fire them concurrently; the shared
+    # limiter keeps the aggregate rate at the MB throttle. Same 10k safety cap
+    # as the serial path.
+    offsets = range(page_size, min(total_count, 10000 + page_size), page_size)
+    pages = await asyncio.gather(
+        *(mb_get_async(session, limiter, "/release", page_params(off)) for off in offsets),
+        return_exceptions=True,
+    )
+    for off, page in zip(offsets, pages):
+        if isinstance(page, Exception):
+            print(f"  [Error] Failed fetching page for {start_date}..{end_date} (offset {off}): {page}", flush=True)
+            continue
+        releases.extend(page.get("releases", []) or [])
+
+    print(f"  > Collected {len(releases)} releases for {start_date}..{end_date}", flush=True)
+    return releases, total_count
 
-    return all_releases
+
+async def fetch_month_releases_async(
+    year: int, month: int, sleep_s: float, page_size: int = 100
+) -> List[Dict[str, Any]]:
+    limiter = _AsyncRateLimiter(sleep_s)
+
+    connector = aiohttp.TCPConnector(limit_per_host=1)
+    timeout = aiohttp.ClientTimeout(connect=10, total=120)
+    headers = {"User-Agent": UA}
+
+    start_date, end_date = _month_range(year, month)
+    print(f"\n--- Processing Range: {start_date} .. {end_date} ---", flush=True)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+        releases, total_count = await _fetch_range_async(
+            session, limiter, start_date, end_date, page_size, abort_over=10000
+        )
+        if total_count > 10000:
+            print(f"[Warn] {total_count} results exceed the 10k window; splitting into weeks.", flush=True)
+            week_results = await asyncio.gather(
+                *(
+                    _fetch_range_async(session, limiter, week_start, week_end, page_size)
+                    for week_start, week_end in _week_ranges(year, month)
+                )
+            )
+            releases = []
+            for week_releases, _ in week_results:
+                releases.extend(week_releases)
+
+    return releases
 
 
 # -------------------------
@@ -306,16 +827,110 @@ def default_out_path(out_dir: str, year: int, month: int) -> str:
 
 
 def load_from_json(path: str) -> Dict[str, Any]:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def _detect_wrapper_key(path: str) -> Optional[str]:
+    """Find which top-level key holds the item list ("releases"/"rows"/"data").
+
+    Uses ijson's lazy event stream, so it stops at the first matching key
+    without parsing the list behind it.
+    """
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == "" and event == "map_key" and value in ("releases", "rows", "data"):
+                return value
+    return None
+
+
+def iter_json_items(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream items from a JSON dump one at a time (--stream-parse)."""
+    key = _detect_wrapper_key(path)
+    if key is None:
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, f"{key}.item")
+
+
+def iter_jsonl_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream rows from a .jsonl dump, skipping the {"_meta": ...} header line."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            item = loads(line)
+            if isinstance(item, dict) and set(item) == {"_meta"}:
+                continue
+            yield item
+
+
+def save_jsonl(path: str, meta: Dict[str, Any], rows: Iterable[Dict[str, Any]]):
+    """Write a dump as newline-delimited JSON (--jsonl).
+
+    One row is serialized at a time, so peak memory stays flat instead of
+    buffering the whole payload the way json.dump/orjson.dumps must. The
+    first line is a {"_meta": ...} header carrying what the wrapper dict of
+    the .json format holds.
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder or ".", prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        if orjson is not None:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps({"_meta": meta}))
+                f.write(b"\n")
+                for row in rows:
+                    f.write(orjson.dumps(row))
+                    f.write(b"\n")
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"_meta": meta}, ensure_ascii=False) + "\n")
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _replace_tmp(tmp_path, path)
+
+
+def _replace_tmp(tmp_path: str, path: str):
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def save_json(path: str, payload: Dict[str, Any]):
     folder = os.path.dirname(path)
     if folder:
         os.makedirs(folder, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
+    # Write to a temp file in the same directory and os.replace it in, so an
+    # interrupted run (or the background writer) never leaves a torn dump
+    fd, tmp_path = tempfile.mkstemp(dir=folder or ".", prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        if orjson is not None:
+            # orjson writes UTF-8 bytes directly (no ensure_ascii escaping to undo)
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _replace_tmp(tmp_path, path)
 
 
 # -------------------------
@@ -345,6 +960,26 @@ def main():
     parser.add_argument("--on-conflict", type=str, default="mb_release_id", help="Unique key column for upsert")
 
     # Optional: keep only minimal fields to match your table
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk MB response cache (requests-cache) for this run",
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Save the normalized dump as newline-delimited JSON (constant-memory write)",
+    )
+    parser.add_argument(
+        "--keep-raw",
+        action="store_true",
+        help="Embed the full raw MB release under full_json on every row (old behavior)",
+    )
+    parser.add_argument(
+        "--stream-parse",
+        action="store_true",
+        help="Parse MB responses / JSON dumps incrementally via ijson (lower peak memory)",
+    )
     parser.add_argument(
         "--minimal",
         action="store_true",
@@ -353,6 +988,10 @@ def main():
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        global SESSION
+        SESSION = make_session(use_cache=False)
+
     # Default: dry-run unless user explicitly stages or writes
     if not (args.dry_run or args.stage or args.write):
         args.dry_run = True
@@ -363,28 +1002,41 @@ def main():
     mode = "DRY-RUN" if args.dry_run else ("STAGE" if args.stage else "WRITE")
     print(f"Mode: {mode}", flush=True)
 
+    if args.stream_parse and ijson is None:
+        print("[Warn] ijson not installed; ignoring --stream-parse.", flush=True)
+        args.stream_parse = False
+
     # -------------------------
     # Load source releases
     # -------------------------
-    releases: List[Dict[str, Any]] = []
+    releases: Iterable[Dict[str, Any]] = []
     source_meta: Dict[str, Any] = {}
 
     if args.from_json:
         # No network calls
-        payload = load_from_json(args.from_json)
-        # Accept either a raw releases dump or a normalized dump
-        if "releases" in payload:
-            releases = payload.get("releases") or []
-        elif "rows" in payload:
-            # If user loads a normalized dump, we can skip normalization by treating rows as already normalized
-            # We'll detect that later.
-            releases = payload.get("rows") or []
+        if args.from_json.endswith(".jsonl"):
+            releases = iter_jsonl_rows(args.from_json)
+            source_meta = {"from_json": args.from_json}
+            print(f"Loaded from JSONL (streaming): {args.from_json}", flush=True)
+        elif args.stream_parse:
+            releases = iter_json_items(args.from_json)
+            source_meta = {"from_json": args.from_json}
+            print(f"Loaded from JSON (streaming): {args.from_json}", flush=True)
         else:
-            # fallback: try common names
-            releases = payload.get("data") or []
-        source_meta = {"from_json": args.from_json}
-        print(f"Loaded from JSON: {args.from_json}", flush=True)
-        print(f"Loaded items: {len(releases)}", flush=True)
+            payload = load_from_json(args.from_json)
+            # Accept either a raw releases dump or a normalized dump
+            if "releases" in payload:
+                releases = payload.get("releases") or []
+            elif "rows" in payload:
+                # If user loads a normalized dump, we can skip normalization by treating rows as already normalized
+                # We'll detect that later.
+                releases = payload.get("rows") or []
+            else:
+                # fallback: try common names
+                releases = payload.get("data") or []
+            source_meta = {"from_json": args.from_json}
+            print(f"Loaded from JSON: {args.from_json}", flush=True)
+            print(f"Loaded items: {len(releases)}", flush=True)
     else:
         # Network fetch requires year/month
         if args.year is None or args.month is None:
@@ -392,58 +1044,69 @@ def main():
         if args.month < 1 or args.month > 12:
             raise SystemExit("--month must be between 1 and 12.")
 
-        releases = fetch_month_releases(args.year, args.month, sleep_s=args.sleep)
+        if args.stream_parse:
+            # Streaming parse is serial by construction (one response on the wire at a time)
+            releases = fetch_month_releases_stream(args.year, args.month, sleep_s=args.sleep)
+        elif aiohttp is not None:
+            releases = asyncio.run(fetch_month_releases_async(args.year, args.month, sleep_s=args.sleep))
+        else:
+            print("[Warn] aiohttp not installed; falling back to serial fetch.", flush=True)
+            releases = fetch_month_releases(args.year, args.month, sleep_s=args.sleep)
         source_meta = {"year": args.year, "month": args.month, "sleep": args.sleep}
 
+        # Preserve the raw fetch once in a companion file instead of embedding
+        # it per-row in the normalized dump (see --keep-raw)
+        if not args.keep_raw and isinstance(releases, list):
+            raw_path = os.path.join(ensure_out_dir(args.out_dir), f"mb_{args.year}_{args.month:02d}.raw.json")
+            save_json(raw_path, {"source": source_meta, "count": len(releases), "releases": releases})
+            print(f"Saved raw dump: {raw_path}", flush=True)
+
     # -------------------------
     # Normalize (or detect already-normalized)
     # -------------------------
-    normalized: List[Dict[str, Any]] = []
-    seen_ids = set()
-    missing_id = 0
-
-    already_normalized = False
-    if releases and isinstance(releases[0], dict) and ("mb_release_id" in releases[0] and "album" in releases[0]):
-        already_normalized = True
-
-    if already_normalized:
-        # De-dupe just in case
-        for row in releases:
+    # releases may be a list or a --stream-parse generator: peek at the first
+    # item to detect an already-normalized dump, then chain it back on.
+    release_iter = iter(releases)
+    first = next(release_iter, None)
+    if first is not None:
+        release_iter = itertools.chain([first], release_iter)
+
+    already_normalized = isinstance(first, dict) and ("mb_release_id" in first and "album" in first)
+
+    # Dedup via one dict insert per row (setdefault = first-seen wins),
+    # replacing the seen-set membership test + add + append triple.
+    by_id: Dict[str, Dict[str, Any]] = {}
+
+    def _dedup_rows(rows: Iterable[Dict[str, Any]]) -> int:
+        missing = 0
+        for row in rows:
             mbid = row.get("mb_release_id")
             if not mbid:
-                missing_id += 1
-                continue
-            if mbid in seen_ids:
+                missing += 1
                 continue
-            seen_ids.add(mbid)
-            normalized.append(row)
+            by_id.setdefault(mbid, row)
+        return missing
+
+    if already_normalized:
+        rows: Iterable[Dict[str, Any]] = release_iter
+        if args.minimal:
+            # Already-normalized dumps carry full rows; strip as they stream by
+            rows = ({k: v for k, v in row.items() if k in MINIMAL_FIELDS} for row in release_iter)
+        missing_id = _dedup_rows(rows)
     else:
-        for r in releases:
-            row = normalize_release(r)
-            mbid = row.get("mb_release_id")
-            if not mbid:
-                missing_id += 1
-                continue
-            if mbid in seen_ids:
-                continue
-            seen_ids.add(mbid)
-            normalized.append(row)
+        # Normalization is pure-CPU and per-release independent: fan it out
+        # across cores. imap_unordered overlaps worker serialization with the
+        # dedup loop here (first-seen wins, in arrival order). Under --minimal
+        # the workers build the small row directly; no post-hoc strip pass.
+        norm_fn = make_normalizer(args.minimal, args.keep_raw)
+        with Pool(processes=os.cpu_count()) as pool:
+            missing_id = _dedup_rows(pool.imap_unordered(norm_fn, release_iter, chunksize=256))
 
-    print(f"Normalized unique rows: {len(normalized)} (skipped missing id: {missing_id})", flush=True)
+    normalized: List[Dict[str, Any]] = list(by_id.values())
 
-    # Optional: strip to minimal fields to match your current DB schema
+    print(f"Normalized unique rows: {len(normalized)} (skipped missing id: {missing_id})", flush=True)
     if args.minimal:
-        keep = {
-            "mb_release_id",
-            "mb_release_group_id",
-            "album",
-            "artist",
-            "release_date",
-            "label",
-            "cover_url",
-        }
-        normalized = [{k: v for k, v in row.items() if k in keep} for row in normalized]
-        print(f"Applied --minimal. Fields kept: {sorted(list(keep))}", flush=True)
+        print(f"Applied --minimal. Fields kept: {sorted(MINIMAL_FIELDS)}", flush=True)
 
     # -------------------------
     # Always save a normalized dump (clean workflow)
@@ -459,18 +1122,34 @@ def main():
         else:
             out_path = default_out_path(args.out_dir, args.year, args.month)
 
-    dump_payload = {
-        "source": source_meta,
-        "count_normalized_unique": len(normalized),
-        "rows": normalized,
-    }
-    save_json(out_path, dump_payload)
-    print(f"Saved normalized dump: {out_path}", flush=True)
+    if args.jsonl:
+        if out_path.endswith(".json"):
+            out_path = out_path[: -len(".json")] + ".jsonl"
+        elif not out_path.endswith(".jsonl"):
+            out_path += ".jsonl"
+
+    def save_dump():
+        if args.jsonl:
+            meta = {
+                "source": source_meta,
+                "count_normalized_unique": len(normalized),
+            }
+            save_jsonl(out_path, meta, normalized)
+        else:
+            dump_payload = {
+                "source": source_meta,
+                "count_normalized_unique": len(normalized),
+                "rows": normalized,
+            }
+            save_json(out_path, dump_payload)
+        print(f"Saved normalized dump: {out_path}", flush=True)
 
     # -------------------------
     # If dry-run, stop here
     # -------------------------
     if args.dry_run:
+        # The save is the only work item; keep it synchronous
+        save_dump()
         sample = normalized[:5]
         print("\nDry-run complete. Sample rows:", flush=True)
         for i, row in enumerate(sample, start=1):
@@ -483,18 +1162,50 @@ def main():
     # -------------------------
     # Stage or Write to Supabase
     # -------------------------
+    # The dump write is disk-bound and independent of the upload: run it on a
+    # background thread so it overlaps the upsert phase, and join before exit.
+    # (save_json/save_jsonl go through a temp file + os.replace, so a failed
+    # or interrupted write never leaves a torn dump.)
+    save_thread = threading.Thread(target=save_dump, daemon=True)
+    save_thread.start()
+
     target_table = args.staging_table if args.stage else args.albums_table
     print(f"\nWriting to Supabase table: {target_table} (upsert on {args.on_conflict})", flush=True)
 
-    chunk_size = 250
+    sb = get_supabase_client()
+
+    chunk_size = 200
     total = len(normalized)
     written = 0
-
-    for start in range(0, total, chunk_size):
-        chunk = normalized[start : start + chunk_size]
-        supabase_upsert_rows(target_table, chunk, on_conflict=args.on_conflict)
-        written += len(chunk)
-        print(f"  Upserted {written}/{total}", flush=True)
+    chunks = [normalized[start : start + chunk_size] for start in range(0, total, chunk_size)]
+
+    # supabase-py is sync but releases the GIL on network I/O, so a small
+    # thread pool keeps several independent PostgREST requests in flight.
+    failed: List[int] = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(supabase_upsert_rows, sb, target_table, chunk, args.on_conflict): i
+            for i, chunk in enumerate(chunks)
+        }
+        for fut in as_completed(futures):
+            i = futures[fut]
+            try:
+                fut.result()
+            except Exception:
+                # Retry each failed chunk once on its own before giving up on it
+                try:
+                    supabase_upsert_rows(sb, target_table, chunks[i], args.on_conflict)
+                except Exception as e:
+                    print(f"  [Error] Chunk {i} failed after retry: {e}", flush=True)
+                    failed.append(i)
+                    continue
+            written += len(chunks[i])
+            print(f"  Upserted {written}/{total}", flush=True)
+
+    save_thread.join()
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} upsert chunk(s) failed: {sorted(failed)}")
 
     print("\nDone.", flush=True)
     if args.stage: